@@ -7,9 +7,13 @@ and extracts information using AI vision models.
 """
 
 import os
-import json
 import argparse
 from pathlib import Path
+from utils import save_json
+
+
+# Screenshot formats written by the scraper (JPEG) and older runs (PNG)
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png"})
 
 
 def analyze_images(screenshot_dir):
@@ -31,8 +35,8 @@ def analyze_images(screenshot_dir):
         print(f"Error: Directory {screenshot_dir} does not exist")
         return {"error": "Directory not found"}
     
-    # Get all PNG files in the directory
-    screenshots = sorted([f for f in screenshot_dir.glob("*.png")])
+    # Get all image files in the directory
+    screenshots = sorted(f for f in screenshot_dir.iterdir() if f.suffix.lower() in IMAGE_SUFFIXES)
     
     if not screenshots:
         print(f"No screenshots found in {screenshot_dir}")
@@ -57,8 +61,7 @@ def analyze_images(screenshot_dir):
     
     # Save results to a JSON file
     output_file = screenshot_dir.parent / f"{screenshot_dir.name}_analysis.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    save_json(results, output_file)
     
     print(f"Analysis results saved to {output_file}")
     return results
@@ -7,18 +7,36 @@ and transcribes the audio content to text.
 """
 
 import os
-import re
 import json
 import asyncio
+import shutil
 import argparse
-import subprocess
 from pathlib import Path
-from urllib.parse import urlparse
+from utils import extract_reel_id, save_json
+
+
+async def _run(argv, **kwargs):
+    """Run a command without blocking the event loop.
+    
+    Args:
+        argv (list): The command and its arguments
+        **kwargs: Extra arguments for asyncio.create_subprocess_exec
+        
+    Returns:
+        int: The command's exit code
+    """
+    proc = await asyncio.create_subprocess_exec(*argv, **kwargs)
+    return await proc.wait()
 
 
 class InstagramAudioExtractor:
-    def __init__(self):
-        """Initialize the Instagram audio extractor."""
+    def __init__(self, concurrent_fragments=8):
+        """Initialize the Instagram audio extractor.
+        
+        Args:
+            concurrent_fragments (int): Number of HLS/DASH fragments yt-dlp downloads in parallel
+        """
+        self.concurrent_fragments = concurrent_fragments
         self.audio_dir = Path("audio")
         self.video_dir = Path("videos")
         self.transcript_dir = Path("transcripts")
@@ -27,6 +45,10 @@ class InstagramAudioExtractor:
         self.audio_dir.mkdir(exist_ok=True)
         self.video_dir.mkdir(exist_ok=True)
         self.transcript_dir.mkdir(exist_ok=True)
+        
+        # Resolve tool paths once instead of spawning a probe per call
+        self._ytdlp = shutil.which("yt-dlp")
+        self._ffmpeg = shutil.which("ffmpeg")
     
     def extract_reel_id(self, url):
         """Extract the reel ID from the URL.
@@ -37,54 +59,33 @@ class InstagramAudioExtractor:
         Returns:
             str: The reel ID
         """
-        # Extract the reel ID from the URL path
-        parsed_url = urlparse(url)
-        path_parts = parsed_url.path.strip('/').split('/')
-        
-        # Find the part that contains 'reel'
-        for i, part in enumerate(path_parts):
-            if part == 'reel' or part == 'reels' or part == 'p':
-                if i + 1 < len(path_parts):
-                    return path_parts[i + 1]
-        
-        # If we can't find it in the path, try to extract from the URL
-        match = re.search(r'/(reel|reels|p)/([^/]+)', parsed_url.path)
-        if match:
-            return match.group(2)
-            
-        return None
+        return extract_reel_id(url)
     
-    def check_dependencies(self):
+    async def check_dependencies(self):
         """Check if required dependencies are installed."""
-        try:
-            # Check for yt-dlp
-            subprocess.run(["yt-dlp", "--version"], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE, 
-                          check=True)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not self._ytdlp:
             print("yt-dlp is not installed. Installing...")
             try:
-                subprocess.run(["pip", "install", "yt-dlp"], check=True)
-            except subprocess.SubprocessError:
+                returncode = await _run(["pip", "install", "yt-dlp"])
+            except OSError:
+                returncode = None
+            if returncode != 0:
                 print("Failed to install yt-dlp. Please install it manually.")
                 return False
+            self._ytdlp = shutil.which("yt-dlp")
+            if not self._ytdlp:
+                print("yt-dlp was installed but is not on PATH. Please install it manually.")
+                return False
         
-        try:
-            # Check for ffmpeg
-            subprocess.run(["ffmpeg", "-version"], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE, 
-                          check=True)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not self._ffmpeg:
             print("ffmpeg is not installed. Please install it manually.")
             print("On macOS: brew install ffmpeg")
             print("On Ubuntu: sudo apt-get install ffmpeg")
             return False
         
-        return True
+        return bool(self._ytdlp and self._ffmpeg)
     
-    def download_video(self, url):
+    async def download_video(self, url):
         """Download the Instagram video.
         
         Args:
@@ -99,28 +100,39 @@ class InstagramAudioExtractor:
         print(f"Downloading video from {url}...")
         try:
             # Use yt-dlp to download the video
-            subprocess.run([
-                "yt-dlp",
+            returncode = await _run([
+                self._ytdlp or "yt-dlp",
                 "--no-warnings",
+                "--concurrent-fragments", str(self.concurrent_fragments),
                 "-o", str(output_path),
                 url
-            ], check=True)
-            
-            if output_path.exists():
-                print(f"Video downloaded successfully: {output_path}")
-                return str(output_path)
-            else:
-                print("Failed to download video")
-                return None
-        except subprocess.SubprocessError as e:
+            ])
+        except OSError as e:
             print(f"Error downloading video: {e}")
             return None
+        
+        if returncode != 0:
+            print(f"Error downloading video: yt-dlp exited with code {returncode}")
+            return None
+        
+        if output_path.exists():
+            print(f"Video downloaded successfully: {output_path}")
+            return str(output_path)
+        else:
+            print("Failed to download video")
+            return None
     
-    def extract_audio(self, video_path):
+    async def extract_audio(self, video_path, mp3=False):
         """Extract audio from the video.
         
+        Instagram reels carry AAC audio, so by default the audio stream is
+        copied into an .m4a file without re-encoding. Whisper reads m4a
+        directly; MP3 encoding is only done when explicitly requested or
+        when the stream cannot be copied.
+        
         Args:
             video_path (str): Path to the video file
+            mp3 (bool): Whether to re-encode the audio to MP3
             
         Returns:
             str: Path to the extracted audio file
@@ -130,29 +142,115 @@ class InstagramAudioExtractor:
             return None
         
         video_path = Path(video_path)
+        
+        if not mp3:
+            audio_path = self.audio_dir / f"{video_path.stem}.m4a"
+            print(f"Extracting audio from {video_path}...")
+            try:
+                # Copy the audio stream as-is, no decode/encode round-trip
+                returncode = await _run([
+                    self._ffmpeg or "ffmpeg",
+                    "-i", str(video_path),
+                    "-vn",
+                    "-acodec", "copy",
+                    "-y",  # Overwrite output file if it exists
+                    str(audio_path)
+                ], stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+            except OSError as e:
+                print(f"Error extracting audio: {e}")
+                return None
+            
+            if returncode == 0 and audio_path.exists():
+                print(f"Audio extracted successfully: {audio_path}")
+                return str(audio_path)
+            print(f"Could not copy audio stream (ffmpeg exited with code {returncode}), re-encoding to MP3...")
+        
         audio_path = self.audio_dir / f"{video_path.stem}.mp3"
         
         print(f"Extracting audio from {video_path}...")
         try:
             # Use ffmpeg to extract audio
-            subprocess.run([
-                "ffmpeg",
+            returncode = await _run([
+                self._ffmpeg or "ffmpeg",
                 "-i", str(video_path),
                 "-q:a", "0",
                 "-map", "a",
                 "-y",  # Overwrite output file if it exists
                 str(audio_path)
-            ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            if audio_path.exists():
-                print(f"Audio extracted successfully: {audio_path}")
-                return str(audio_path)
-            else:
-                print("Failed to extract audio")
-                return None
-        except subprocess.SubprocessError as e:
+            ], stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        except OSError as e:
             print(f"Error extracting audio: {e}")
             return None
+        
+        if returncode != 0:
+            print(f"Error extracting audio: ffmpeg exited with code {returncode}")
+            return None
+        
+        if audio_path.exists():
+            print(f"Audio extracted successfully: {audio_path}")
+            return str(audio_path)
+        else:
+            print("Failed to extract audio")
+            return None
+    
+    async def download_and_extract_audio(self, url):
+        """Download the Instagram video and extract its audio in one stream.
+        
+        yt-dlp writes the video to stdout and ffmpeg reads it from stdin,
+        so the mp4 is never written to disk and both stages run together.
+        
+        Args:
+            url (str): The Instagram reel URL
+            
+        Returns:
+            str: Path to the extracted audio file
+        """
+        reel_id = self.extract_reel_id(url) or "instagram_video"
+        audio_path = self.audio_dir / f"{reel_id}.m4a"
+        
+        print(f"Streaming audio from {url}...")
+        read_fd, write_fd = os.pipe()
+        download = None
+        try:
+            try:
+                download = await asyncio.create_subprocess_exec(
+                    self._ytdlp or "yt-dlp",
+                    "-o", "-",
+                    "--no-warnings",
+                    "--concurrent-fragments", str(self.concurrent_fragments),
+                    url,
+                    stdout=write_fd
+                )
+                extract = await asyncio.create_subprocess_exec(
+                    self._ffmpeg or "ffmpeg",
+                    "-i", "pipe:0",
+                    "-vn",
+                    "-c:a", "copy",
+                    "-y",  # Overwrite output file if it exists
+                    str(audio_path),
+                    stdin=read_fd,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            finally:
+                # The children hold their own copies; closing ours lets yt-dlp
+                # receive SIGPIPE if ffmpeg exits early, and ffmpeg see EOF
+                os.close(read_fd)
+                os.close(write_fd)
+            extract_code, download_code = await asyncio.gather(extract.wait(), download.wait())
+        except OSError as e:
+            print(f"Error streaming audio: {e}")
+            if download is not None and download.returncode is None:
+                download.kill()
+                await download.wait()
+            return None
+        
+        if download_code == 0 and extract_code == 0 and audio_path.exists():
+            print(f"Audio extracted successfully: {audio_path}")
+            return str(audio_path)
+        
+        print(f"Failed to stream audio (yt-dlp: {download_code}, ffmpeg: {extract_code})")
+        return None
     
     def transcribe_audio(self, audio_path):
         """Transcribe the audio to text.
@@ -176,7 +274,7 @@ class InstagramAudioExtractor:
         
         print(f"Audio file ready for transcription: {audio_path}")
         print("To transcribe this audio, you can use:")
-        print("1. OpenAI Whisper (local): whisper audio_file.mp3 --model medium")
+        print(f"1. Whisper (local): python transcribe_audio.py {audio_path} --model medium")
         print("2. Google Speech-to-Text API")
         print("3. AWS Transcribe")
         print("4. Other transcription services")
@@ -189,33 +287,41 @@ class InstagramAudioExtractor:
         }
         
         # Save the transcript info
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, indent=2)
+        save_json(transcript, transcript_path)
         
         print(f"Transcript info saved: {transcript_path}")
         return transcript
     
-    def process(self, url):
+    async def process(self, url, keep_video=False):
         """Process an Instagram reel: download, extract audio, and prepare for transcription.
         
         Args:
             url (str): The Instagram reel URL
+            keep_video (bool): Whether to save the video file as well as the audio
             
         Returns:
             dict: Processing result
         """
-        if not self.check_dependencies():
+        if not await self.check_dependencies():
             return {"error": "Missing dependencies"}
         
-        # Download the video
-        video_path = self.download_video(url)
-        if not video_path:
-            return {"error": "Failed to download video"}
+        video_path = None
+        audio_path = None
+        
+        # Stream straight to audio when the video itself isn't needed
+        if not keep_video:
+            audio_path = await self.download_and_extract_audio(url)
         
-        # Extract audio
-        audio_path = self.extract_audio(video_path)
         if not audio_path:
-            return {"error": "Failed to extract audio"}
+            # Download the video
+            video_path = await self.download_video(url)
+            if not video_path:
+                return {"error": "Failed to download video"}
+            
+            # Extract audio
+            audio_path = await self.extract_audio(video_path)
+            if not audio_path:
+                return {"error": "Failed to extract audio"}
         
         # Prepare for transcription
         transcript = self.transcribe_audio(audio_path)
@@ -233,18 +339,20 @@ def main():
     """Main function to run the audio extractor."""
     parser = argparse.ArgumentParser(description='Instagram Audio Extractor and Transcriber')
     parser.add_argument('url', help='URL of the Instagram reel')
+    parser.add_argument('--keep-video', action='store_true', help='Also save the downloaded video')
     
     args = parser.parse_args()
     
     extractor = InstagramAudioExtractor()
-    result = extractor.process(args.url)
+    result = asyncio.run(extractor.process(args.url, keep_video=args.keep_video))
     
     print("\nProcessing completed!")
     if "error" in result:
         print(f"Error: {result['error']}")
     else:
         print(f"Reel ID: {result['reel_id']}")
-        print(f"Video saved: {result['video_path']}")
+        if result['video_path']:
+            print(f"Video saved: {result['video_path']}")
         print(f"Audio saved: {result['audio_path']}")
         print(f"Transcript info: {json.dumps(result['transcript'], indent=2)}")
 
@@ -7,25 +7,28 @@ It uses Playwright to automate browser interactions and handle dynamic content.
 """
 
 import os
-import re
 import time
 import json
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
 from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from audio_transcriber import InstagramAudioExtractor
+from utils import extract_reel_id, save_json
 
 
 class InstagramScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, jpeg_quality=85):
         """Initialize the Instagram scraper.
         
         Args:
             headless (bool): Whether to run the browser in headless mode
+            jpeg_quality (int): JPEG quality (0-100) for saved screenshots
         """
         # Always use visible browser for Instagram to avoid detection
         self.headless = False  # Force non-headless mode
+        self.jpeg_quality = jpeg_quality
         self.screenshot_dir = Path("screenshots")
         self.transcript_dir = Path("transcripts")
         
@@ -33,8 +36,12 @@ class InstagramScraper:
         self.screenshot_dir.mkdir(exist_ok=True)
         self.transcript_dir.mkdir(exist_ok=True)
         
-    async def setup(self):
-        """Set up the browser and page."""
+    async def setup(self, open_page=True):
+        """Set up the browser and page.
+        
+        Args:
+            open_page (bool): Whether to open the main page; scrape_many opens its own pages
+        """
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
@@ -61,7 +68,7 @@ class InstagramScraper:
         
         # Set default timeouts
         self.context.set_default_timeout(60000)  # 60 seconds
-        self.page = await self.context.new_page()
+        self.page = await self.context.new_page() if open_page else None
         
     async def close(self):
         """Close the browser and playwright."""
@@ -79,34 +86,21 @@ class InstagramScraper:
         Returns:
             str: The reel ID
         """
-        # Extract the reel ID from the URL path
-        parsed_url = urlparse(url)
-        path_parts = parsed_url.path.strip('/').split('/')
-        
-        # Find the part that contains 'reel'
-        for i, part in enumerate(path_parts):
-            if part == 'reel' or part == 'reels' or part == 'p':
-                if i + 1 < len(path_parts):
-                    return path_parts[i + 1]
-        
-        # If we can't find it in the path, try to extract from the URL
-        match = re.search(r'/(reel|reels|p)/([^/]+)', parsed_url.path)
-        if match:
-            return match.group(2)
-            
-        return None
+        return extract_reel_id(url)
     
-    async def take_screenshots(self, url, interval=2, max_duration=60):
+    async def take_screenshots(self, url, interval=2, max_duration=60, page=None):
         """Take screenshots of the reel at regular intervals.
         
         Args:
             url (str): The Instagram reel URL
             interval (int): Interval between screenshots in seconds
             max_duration (int): Maximum duration to capture in seconds
+            page (Page): Page to capture, defaults to the scraper's main page
             
         Returns:
             list: Paths to the saved screenshots
         """
+        page = page or self.page
         reel_id = self.extract_reel_id(url) or datetime.now().strftime("%Y%m%d%H%M%S")
         screenshot_paths = []
         
@@ -118,60 +112,205 @@ class InstagramScraper:
         start_time = time.time()
         screenshot_count = 0
         
-        while time.time() - start_time < max_duration:
-            screenshot_path = reel_dir / f"screenshot_{screenshot_count:03d}.png"
-            await self.page.screenshot(path=str(screenshot_path))
-            screenshot_paths.append(str(screenshot_path))
-            print(f"Screenshot saved: {screenshot_path}")
+        # Each capture runs in the background so it overlaps the next interval's wait
+        async with asyncio.TaskGroup() as tg:
+            while time.time() - start_time < max_duration:
+                screenshot_path = reel_dir / f"screenshot_{screenshot_count:03d}.jpg"
+                tg.create_task(self._save_screenshot(screenshot_path, page))
+                screenshot_paths.append(str(screenshot_path))
+                
+                screenshot_count += 1
+                await asyncio.sleep(interval)
+                
+                # Check if video has ended (this is approximate)
+                try:
+                    # Check if the video is still playing or has controls visible
+                    is_playing = await page.evaluate("""
+                        () => {
+                            // Check for common video elements
+                            const video = document.querySelector('video');
+                            if (video) {
+                                return !video.paused && !video.ended;
+                            }
+                            return false;
+                        }
+                    """)
+                    
+                    if not is_playing:
+                        print("Video appears to have ended")
+                        break
+                except Exception as e:
+                    print(f"Error checking video state: {e}")
+        
+        return screenshot_paths
+    
+    async def _save_screenshot(self, screenshot_path, page):
+        """Capture the current page as a JPEG screenshot.
+        
+        Args:
+            screenshot_path (Path): Where to save the screenshot
+            page (Page): Page to capture
+        """
+        await page.screenshot(path=str(screenshot_path), type="jpeg", quality=self.jpeg_quality)
+        print(f"Screenshot saved: {screenshot_path}")
+    
+    def _frame_output_args(self, reel_dir, interval, max_duration=None):
+        """Build the ffmpeg output arguments that write one JPEG frame per interval.
+        
+        Args:
+            reel_dir (Path): Directory to save the frames in
+            interval (int): Interval between frames in seconds
+            max_duration (int): Maximum duration to capture in seconds, or None for all
             
-            screenshot_count += 1
-            await asyncio.sleep(interval)
+        Returns:
+            list: ffmpeg arguments for the frame output
+        """
+        # Map JPEG quality (0-100) onto ffmpeg's -q:v scale (2 best, 31 worst)
+        qscale = max(2, min(31, round(31 - self.jpeg_quality * 29 / 100)))
+        
+        args = [
+            "-map", "0:v",
+            "-vf", f"fps=1/{interval}",
+            "-vsync", "vfr",
+            "-q:v", str(qscale)
+        ]
+        if max_duration:
+            # Output option, so it only limits this output
+            args += ["-t", str(max_duration)]
+        return args + [str(reel_dir / "screenshot_%03d.jpg")]
+    
+    def _clear_frames(self, reel_dir):
+        """Remove frames left in a reel directory by an earlier run.
+        
+        Args:
+            reel_dir (Path): Directory the frames are saved in
+        """
+        for old_frame in reel_dir.glob("screenshot_*.jpg"):
+            old_frame.unlink()
+    
+    async def _run_ffmpeg(self, video_path, output_args):
+        """Run ffmpeg on a video with the given output arguments.
+        
+        Args:
+            video_path (str): Path to the input video file
+            output_args (list): ffmpeg arguments describing the outputs
             
-            # Check if video has ended (this is approximate)
-            try:
-                # Check if the video is still playing or has controls visible
-                is_playing = await self.page.evaluate("""
-                    () => {
-                        // Check for common video elements
-                        const video = document.querySelector('video');
-                        if (video) {
-                            return !video.paused && !video.ended;
-                        }
-                        return false;
-                    }
-                """)
-                
-                if not is_playing:
-                    print("Video appears to have ended")
-                    break
-            except Exception as e:
-                print(f"Error checking video state: {e}")
+        Returns:
+            tuple: (whether ffmpeg succeeded, ffmpeg's error output)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel", "error",
+                "-y",  # Overwrite output files if they exist
+                "-i", str(video_path),
+                *output_args,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+        except FileNotFoundError:
+            print("ffmpeg is not installed")
+            return False, ""
+        
+        error_output = stderr.decode(errors="replace").strip()
+        if proc.returncode != 0:
+            print(f"ffmpeg exited with code {proc.returncode}: {error_output}")
+            return False, error_output
+        return True, error_output
+    
+    async def extract_frames_ffmpeg(self, video_path, reel_dir, interval=2, max_duration=None):
+        """Extract frames from a downloaded video with a single ffmpeg pass.
         
+        Args:
+            video_path (str): Path to the downloaded video file
+            reel_dir (Path): Directory to save the frames in
+            interval (int): Interval between frames in seconds
+            max_duration (int): Maximum duration to capture in seconds, or None for all
+            
+        Returns:
+            list: Paths to the saved screenshots, or None if ffmpeg failed
+        """
+        reel_dir = Path(reel_dir)
+        reel_dir.mkdir(parents=True, exist_ok=True)
+        # The frame list is read back from disk, so start from an empty directory
+        self._clear_frames(reel_dir)
+        
+        # One decode pass emits every frame instead of N browser screenshots
+        ok, _ = await self._run_ffmpeg(video_path, self._frame_output_args(reel_dir, interval, max_duration))
+        if not ok:
+            return None
+        
+        screenshot_paths = [str(p) for p in sorted(reel_dir.glob("screenshot_*.jpg"))]
+        print(f"Extracted {len(screenshot_paths)} frames to {reel_dir}")
         return screenshot_paths
     
-    async def extract_transcript(self, url):
+    async def extract_audio_and_frames(self, video_path, audio_path, reel_dir, interval=2, max_duration=None):
+        """Extract the audio track and frames from a video in one ffmpeg pass.
+        
+        The video is demuxed once; the audio stream is copied to audio_path
+        while the decoded video feeds the frame output. If the video has no
+        audio stream, only the frames are extracted.
+        
+        Args:
+            video_path (str): Path to the downloaded video file
+            audio_path (Path): Where to save the audio (.m4a)
+            reel_dir (Path): Directory to save the frames in
+            interval (int): Interval between frames in seconds
+            max_duration (int): Maximum duration of frames to capture in seconds,
+                or None for all; the audio is always extracted in full
+            
+        Returns:
+            tuple: (audio path or None, paths to the saved screenshots or None if ffmpeg failed)
+        """
+        reel_dir = Path(reel_dir)
+        reel_dir.mkdir(parents=True, exist_ok=True)
+        # The frame list is read back from disk, so start from an empty directory
+        self._clear_frames(reel_dir)
+        
+        output_args = [
+            "-map", "0:a",
+            "-c:a", "copy",
+            str(audio_path),
+            *self._frame_output_args(reel_dir, interval, max_duration)
+        ]
+        ok, error_output = await self._run_ffmpeg(video_path, output_args)
+        if not ok:
+            if "Stream map '0:a' matches no streams" not in error_output:
+                return None, None
+            print("Video has no audio track, extracting frames only")
+            return None, await self.extract_frames_ffmpeg(video_path, reel_dir, interval, max_duration)
+        
+        screenshot_paths = [str(p) for p in sorted(reel_dir.glob("screenshot_*.jpg"))]
+        print(f"Audio extracted: {audio_path}")
+        print(f"Extracted {len(screenshot_paths)} frames to {reel_dir}")
+        return audio_path, screenshot_paths
+    
+    async def extract_transcript(self, url, page=None):
         """Extract the transcript from the Instagram reel.
         
         Args:
             url (str): The Instagram reel URL
+            page (Page): Page to read from, defaults to the scraper's main page
             
         Returns:
             dict: The transcript data
         """
+        page = page or self.page
         reel_id = self.extract_reel_id(url) or datetime.now().strftime("%Y%m%d%H%M%S")
         
         # Wait for captions to load (they might be in different elements)
-        await self.page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("networkidle")
         
         # Try different methods to extract captions/transcript
         transcript = {}
         
         try:
-            # Method 1: Look for caption/text elements
-            caption_text = await self.page.evaluate("""
+            # Look for captions and closed captions in a single round-trip
+            texts = await page.evaluate("""
                 () => {
-                    // Try different selectors that might contain captions
-                    const selectors = [
+                    // Selectors that might contain captions
+                    const captionSelectors = [
                         'div[data-visualcompletion="caption-text"]',
                         'div.caption-container',
                         'span.caption',
@@ -182,35 +321,8 @@ class InstagramScraper:
                         'span[data-lexical-text="true"]' // New Instagram text class
                     ];
                     
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        if (elements && elements.length > 0) {
-                            return Array.from(elements).map(el => el.textContent).join(' ');
-                        }
-                    }
-                    
-                    // Try to find any visible text in the post
-                    const article = document.querySelector('article');
-                    if (article) {
-                        return article.innerText;
-                    }
-                    
-                    return '';
-                }
-            """)
-            
-            if caption_text and caption_text.strip():
-                transcript['caption'] = caption_text.strip()
-        
-        except Exception as e:
-            print(f"Error extracting caption: {e}")
-        
-        try:
-            # Method 2: Look for closed captions/subtitles if available
-            cc_text = await self.page.evaluate("""
-                () => {
-                    // Try different selectors that might contain closed captions
-                    const selectors = [
+                    // Selectors that might contain closed captions
+                    const ccSelectors = [
                         'div.closed-captions',
                         'div.subtitles-container',
                         'div._a3gq',  // Instagram CC container
@@ -218,69 +330,173 @@ class InstagramScraper:
                         'div._9zwu' // Another potential CC class
                     ];
                     
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        if (elements && elements.length > 0) {
-                            return Array.from(elements).map(el => el.textContent).join(' ');
+                    const first = (selectors) => {
+                        for (const selector of selectors) {
+                            const elements = document.querySelectorAll(selector);
+                            if (elements && elements.length > 0) {
+                                return Array.from(elements).map(el => el.textContent).join(' ');
+                            }
+                        }
+                        return '';
+                    };
+                    
+                    let caption = first(captionSelectors);
+                    if (!caption) {
+                        // Try to find any text in the post (textContent avoids forcing a layout)
+                        const article = document.querySelector('article');
+                        if (article) {
+                            caption = article.textContent;
                         }
                     }
                     
-                    return '';
+                    return {caption: caption || '', cc: first(ccSelectors)};
                 }
             """)
             
+            caption_text = texts.get('caption', '')
+            if caption_text and caption_text.strip():
+                transcript['caption'] = caption_text.strip()
+            
+            cc_text = texts.get('cc', '')
             if cc_text and cc_text.strip():
                 transcript['closed_captions'] = cc_text.strip()
         
         except Exception as e:
-            print(f"Error extracting closed captions: {e}")
+            print(f"Error extracting captions: {e}")
         
         # Save transcript to file
         transcript_path = self.transcript_dir / f"{reel_id}_transcript.json"
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, ensure_ascii=False, indent=2)
+        save_json(transcript, transcript_path)
             
         print(f"Transcript saved: {transcript_path}")
         return transcript
     
-    async def handle_dialogs(self):
-        """Handle any dialogs that might appear (cookie notices, login prompts, etc.)"""
+    async def handle_dialogs(self, page=None):
+        """Handle any dialogs that might appear (cookie notices, login prompts, etc.)
+        
+        Args:
+            page (Page): Page to handle dialogs on, defaults to the scraper's main page
+        """
+        page = page or self.page
         try:
             # Handle cookie consent dialog
             cookie_buttons = [
-                'button[contains(text(), "Accept")]',
-                'button[contains(text(), "Allow")]',
-                'button[contains(text(), "I Accept")]',
-                'button[contains(text(), "Accept All")]',
-                'button[contains(text(), "Continue")]',
-                'button[contains(text(), "Close")]',
+                'button:has-text("Accept")',
+                'button:has-text("Allow")',
+                'button:has-text("I Accept")',
+                'button:has-text("Accept All")',
+                'button:has-text("Continue")',
+                'button:has-text("Close")',
                 '[aria-label="Close"]',
                 '[aria-label="Cancel"]'
             ]
             
-            for selector in cookie_buttons:
-                try:
-                    if await self.page.locator(selector).count() > 0:
-                        print(f"Clicking dialog button: {selector}")
-                        await self.page.locator(selector).click()
-                        await self.page.wait_for_timeout(1000)
-                except Exception as e:
-                    print(f"Error clicking {selector}: {e}")
-                    continue
+            # Combine the selectors so the browser resolves them in one query
+            dialog_button = page.locator(cookie_buttons[0])
+            for selector in cookie_buttons[1:]:
+                dialog_button = dialog_button.or_(page.locator(selector))
+            
+            try:
+                await dialog_button.first.click(timeout=500)
+                print("Clicked dialog button")
+                await page.wait_for_timeout(1000)
+            except PlaywrightTimeoutError:
+                pass
+            except Exception as e:
+                print(f"Error clicking dialog button: {e}")
             
             # Handle login prompt
             try:
-                not_now_button = self.page.locator('button:has-text("Not Now")')
-                if await not_now_button.count() > 0:
-                    print("Clicking 'Not Now' on login prompt")
-                    await not_now_button.click()
-                    await self.page.wait_for_timeout(1000)
+                await page.locator('button:has-text("Not Now")').first.click(timeout=500)
+                print("Clicked 'Not Now' on login prompt")
+                await page.wait_for_timeout(1000)
+            except PlaywrightTimeoutError:
+                pass
             except Exception as e:
                 print(f"Error handling login prompt: {e}")
                 
         except Exception as e:
             print(f"Error in handle_dialogs: {e}")
     
+    async def scrape_one(self, url, screenshot_interval=2, max_duration=60, page=None):
+        """Scrape a single reel using an already running browser.
+        
+        Args:
+            url (str): The Instagram reel URL
+            screenshot_interval (int): Interval between screenshots in seconds
+            max_duration (int): Maximum duration to capture in seconds
+            page (Page): Page to scrape in, defaults to the scraper's main page
+            
+        Returns:
+            dict: The scraped data
+        """
+        page = page or self.page
+        
+        # Navigate to the URL
+        print(f"Navigating to {url}")
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        print("Page loaded, waiting for content...")
+        
+        # Handle any dialogs that might appear
+        await self.handle_dialogs(page)
+        
+        # Wait for the page to stabilize
+        await page.wait_for_timeout(5000)
+        if page is self.page:
+            # Concurrent pages from scrape_many would overwrite each other's capture
+            print("Taking initial screenshot...")
+            await page.screenshot(path="initial_page.png")
+        
+        # Try different selectors for video
+        video_selectors = ["video", "[role=button] video", ".tWeCl video", ".EmbeddedMediaVideo"]
+        video_found = False
+        
+        for selector in video_selectors:
+            try:
+                print(f"Looking for video with selector: {selector}")
+                await page.wait_for_selector(selector, state="attached", timeout=10000)
+                video_found = True
+                print(f"Found video with selector: {selector}")
+                break
+            except Exception:
+                print(f"Selector {selector} not found")
+        
+        if not video_found:
+            print("Could not find video element, continuing anyway...")
+        
+        # Get basic metadata
+        reel_id = self.extract_reel_id(url)
+        print(f"Processing reel: {reel_id}")
+        
+        # Extract transcript
+        print("Extracting transcript...")
+        transcript = await self.extract_transcript(url, page)
+        
+        # Prefer extracting frames from the downloaded video over live screenshots
+        screenshot_paths = None
+        audio_path = None
+        extractor = InstagramAudioExtractor()
+        video_path = await extractor.download_video(url)
+        if video_path:
+            reel_dir = self.screenshot_dir / (reel_id or datetime.now().strftime("%Y%m%d%H%M%S"))
+            audio_path = extractor.audio_dir / f"{Path(video_path).stem}.m4a"
+            print(f"Extracting audio and frames every {screenshot_interval} seconds from {video_path}...")
+            audio_path, screenshot_paths = await self.extract_audio_and_frames(
+                video_path, audio_path, reel_dir, screenshot_interval, max_duration
+            )
+        
+        if screenshot_paths is None:
+            print(f"Taking screenshots every {screenshot_interval} seconds (max {max_duration} seconds)...")
+            screenshot_paths = await self.take_screenshots(url, screenshot_interval, max_duration, page)
+        
+        return {
+            "reel_id": reel_id,
+            "url": url,
+            "transcript": transcript,
+            "screenshots": screenshot_paths,
+            "audio_path": str(audio_path) if audio_path else None
+        }
+    
     async def scrape_reel(self, url, screenshot_interval=2, max_duration=60):
         """Scrape an Instagram reel for transcript and screenshots.
         
@@ -294,59 +510,50 @@ class InstagramScraper:
         """
         try:
             await self.setup()
+            return await self.scrape_one(url, screenshot_interval, max_duration)
             
-            # Navigate to the URL
-            print(f"Navigating to {url}")
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            print("Page loaded, waiting for content...")
-            
-            # Handle any dialogs that might appear
-            await self.handle_dialogs()
-            
-            # Wait for the page to stabilize
-            await self.page.wait_for_timeout(5000)
-            print("Taking initial screenshot...")
-            await self.page.screenshot(path="initial_page.png")
+        except Exception as e:
+            print(f"Error scraping reel: {e}")
+            return {"error": str(e)}
             
-            # Try different selectors for video
-            video_selectors = ["video", "[role=button] video", ".tWeCl video", ".EmbeddedMediaVideo"]
-            video_found = False
+        finally:
+            await self.close()
+    
+    async def scrape_many(self, urls, screenshot_interval=2, max_duration=60, concurrency=4):
+        """Scrape several reels concurrently in one shared browser.
+        
+        Each reel gets its own page in the shared context, so the browser
+        starts once and page loads for different reels overlap.
+        
+        Args:
+            urls (list): The Instagram reel URLs
+            screenshot_interval (int): Interval between screenshots in seconds
+            max_duration (int): Maximum duration to capture in seconds
+            concurrency (int): Maximum number of reels scraped at once
             
-            for selector in video_selectors:
+        Returns:
+            list: The scraped data for each URL, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scrape_with_page(url):
+            async with semaphore:
+                page = await self.context.new_page()
                 try:
-                    print(f"Looking for video with selector: {selector}")
-                    await self.page.wait_for_selector(selector, state="attached", timeout=10000)
-                    video_found = True
-                    print(f"Found video with selector: {selector}")
-                    break
-                except Exception:
-                    print(f"Selector {selector} not found")
-            
-            if not video_found:
-                print("Could not find video element, continuing anyway...")
-            
-            # Get basic metadata
-            reel_id = self.extract_reel_id(url)
-            print(f"Processing reel: {reel_id}")
-            
-            # Extract transcript
-            print("Extracting transcript...")
-            transcript = await self.extract_transcript(url)
-            
-            # Take screenshots
-            print(f"Taking screenshots every {screenshot_interval} seconds (max {max_duration} seconds)...")
-            screenshot_paths = await self.take_screenshots(url, screenshot_interval, max_duration)
-            
-            return {
-                "reel_id": reel_id,
-                "url": url,
-                "transcript": transcript,
-                "screenshots": screenshot_paths
-            }
+                    return await self.scrape_one(url, screenshot_interval, max_duration, page)
+                except Exception as e:
+                    print(f"Error scraping reel {url}: {e}")
+                    return {"url": url, "error": str(e)}
+                finally:
+                    await page.close()
+        
+        try:
+            await self.setup(open_page=False)
+            return await asyncio.gather(*(scrape_with_page(url) for url in urls))
             
         except Exception as e:
-            print(f"Error scraping reel: {e}")
-            return {"error": str(e)}
+            print(f"Error scraping reels: {e}")
+            return [{"url": url, "error": str(e)} for url in urls]
             
         finally:
             await self.close()
@@ -357,23 +564,31 @@ async def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Instagram Reel Scraper')
-    parser.add_argument('url', help='URL of the Instagram reel')
+    parser.add_argument('urls', nargs='+', help='URL(s) of the Instagram reel(s)')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--interval', type=int, default=2, help='Screenshot interval in seconds')
     parser.add_argument('--max-duration', type=int, default=60, help='Maximum duration to capture in seconds')
+    parser.add_argument('--quality', type=int, default=85, help='JPEG quality for screenshots (0-100)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Reels scraped at once when given several URLs')
     
     args = parser.parse_args()
     
-    scraper = InstagramScraper(headless=args.headless)
-    result = await scraper.scrape_reel(args.url, args.interval, args.max_duration)
+    scraper = InstagramScraper(headless=args.headless, jpeg_quality=args.quality)
+    if len(args.urls) > 1:
+        results = await scraper.scrape_many(args.urls, args.interval, args.max_duration, args.concurrency)
+    else:
+        results = [await scraper.scrape_reel(args.urls[0], args.interval, args.max_duration)]
     
     print("\nScraping completed!")
-    if "error" in result:
-        print(f"Error: {result['error']}")
-    else:
-        print(f"Reel ID: {result['reel_id']}")
-        print(f"Transcript: {json.dumps(result['transcript'], indent=2)}")
-        print(f"Screenshots: {len(result['screenshots'])} saved")
+    for result in results:
+        if "error" in result:
+            print(f"Error: {result['error']}")
+        else:
+            print(f"Reel ID: {result['reel_id']}")
+            print(f"Transcript: {json.dumps(result['transcript'], indent=2)}")
+            print(f"Screenshots: {len(result['screenshots'])} saved")
+            if result['audio_path']:
+                print(f"Audio saved: {result['audio_path']}")
 
 
 if __name__ == "__main__":
@@ -2,17 +2,383 @@
 """
 Audio Transcription Script using Whisper
 
-This script transcribes audio files using OpenAI's Whisper model.
+This script transcribes audio files using Whisper models served by
+faster-whisper (CTranslate2 backend with INT8 quantization).
 """
 
 import os
-import json
+import bisect
 import argparse
-import whisper
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import ctranslate2
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+from huggingface_hub.utils import LocalEntryNotFoundError
 from pathlib import Path
+from utils import save_json
 
 
-def transcribe_audio(audio_path, model_name="base", output_dir="transcripts"):
+# Silero VAD settings: split on short pauses so music and silence between
+# phrases are dropped before they reach the encoder
+VAD_PARAMETERS = {"min_silence_duration_ms": 500, "speech_pad_ms": 200}
+
+# Whisper's input rate and window length; batched clips must fit one window
+SAMPLING_RATE = 16000
+CHUNK_SECONDS = 30
+
+# Full batches of clips decoded and transcribed together; bounds how much
+# decoded audio is held in memory during a batch run
+GROUP_BATCHES = 4
+
+# Mel frames per second (hop length of 160 samples); segment "seek" is in frames
+FRAMES_PER_SECOND = SAMPLING_RATE // 160
+
+# Loaded models keyed by name, so repeated calls skip the load
+_MODEL_CACHE = {}
+
+# Model held by each process-pool worker, set once by _init_worker
+_worker_model = None
+
+
+def cuda_available():
+    """Return True if CTranslate2 can see a CUDA device."""
+    try:
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+def _create_model(model_name, cpu_threads=0):
+    """
+    Build a new Whisper model.
+    
+    Weights already in the local download cache are loaded without
+    contacting the model hub; they are only fetched on first use.
+    
+    Args:
+        model_name (str): Whisper model to use (tiny, base, small, medium, large)
+        cpu_threads (int): CTranslate2 threads per model on CPU (0 uses its default)
+        
+    Returns:
+        WhisperModel: The loaded model
+    """
+    print(f"Loading Whisper model: {model_name}")
+    compute_type = "int8_float16" if cuda_available() else "int8"
+    try:
+        return WhisperModel(model_name, device="auto", compute_type=compute_type,
+                            cpu_threads=cpu_threads, local_files_only=True)
+    except LocalEntryNotFoundError:
+        # Only a missing local copy triggers a download; other errors propagate
+        print(f"Downloading Whisper model: {model_name}")
+        return WhisperModel(model_name, device="auto", compute_type=compute_type,
+                            cpu_threads=cpu_threads)
+
+
+def load_model(model_name):
+    """
+    Load a Whisper model, reusing it across calls with the same name.
+    
+    Args:
+        model_name (str): Whisper model to use (tiny, base, small, medium, large)
+        
+    Returns:
+        WhisperModel: The loaded model
+    """
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        model = _MODEL_CACHE[model_name] = _create_model(model_name)
+    return model
+
+
+def _init_worker(model_name, cpu_threads):
+    """Load the Whisper model once per process-pool worker."""
+    global _worker_model
+    # Always build a fresh model: CTranslate2's thread pool does not
+    # survive being copied into a child process
+    _worker_model = _create_model(model_name, cpu_threads)
+
+
+def _save_transcript(segments, language, transcript_path, time_offset=0.0):
+    """
+    Build the transcript dict from Whisper segments and save it.
+    
+    Args:
+        segments (list): Transcribed segments
+        language (str): Detected language
+        transcript_path (Path): Where to save the transcript
+        time_offset (float): Seconds to subtract from segment timestamps and seek
+        
+    Returns:
+        dict: Transcription result
+    """
+    seek_offset = int(time_offset * FRAMES_PER_SECOND)
+    
+    # Token IDs are left out: they make up most of the file and nothing
+    # downstream reads them.
+    transcript = {
+        "text": " ".join(s.text.strip() for s in segments),
+        "segments": [
+            {
+                "id": i,
+                "seek": s.seek - seek_offset,
+                "start": round(s.start - time_offset, 3),
+                "end": round(s.end - time_offset, 3),
+                "text": s.text,
+                "temperature": s.temperature,
+                "avg_logprob": round(s.avg_logprob, 4),
+                "compression_ratio": s.compression_ratio,
+                "no_speech_prob": s.no_speech_prob
+            }
+            for i, s in enumerate(segments, 1)
+        ],
+        "language": language
+    }
+    
+    # Save the transcript
+    save_json(transcript, transcript_path, indent=False)
+    
+    print(f"Transcript saved: {transcript_path}")
+    return transcript
+
+
+def _transcribe_with_model(model, audio_path, output_dir, vad=True, language=None):
+    """
+    Transcribe an audio file with an already loaded model and save the result.
+    
+    Args:
+        model (WhisperModel): The loaded Whisper model
+        audio_path (Path): Path to the audio file
+        output_dir (Path): Directory to save the transcript
+        vad (bool): Whether to skip non-speech regions before transcribing
+        language (str): Language code (e.g. "en"); detected when None
+        
+    Returns:
+        dict: Transcription result
+    """
+    transcript_path = output_dir / f"{audio_path.stem}_whisper_transcript.json"
+    
+    print(f"Transcribing audio: {audio_path}")
+    # Transcribe the audio, skipping silence with the built-in VAD filter.
+    # Segment timestamps are mapped back to the original audio timeline.
+    segments, info = model.transcribe(
+        str(audio_path),
+        language=language,
+        beam_size=5,
+        vad_filter=vad,
+        vad_parameters=VAD_PARAMETERS if vad else None
+    )
+    
+    # Segments are generated lazily, so decoding happens here
+    segments = list(segments)
+    
+    if vad:
+        print(f"Speech detected: {info.duration_after_vad:.1f}s of {info.duration:.1f}s")
+    
+    return _save_transcript(segments, info.language, transcript_path)
+
+
+def _speech_clips(audio, vad=True):
+    """
+    Split decoded audio into clips no longer than one Whisper window.
+    
+    Args:
+        audio (numpy.ndarray): 16 kHz mono audio
+        vad (bool): Whether to keep only detected speech
+        
+    Returns:
+        list: Clips as dicts with "start" and "end" sample indices
+    """
+    if vad:
+        vad_options = VadOptions(**VAD_PARAMETERS, max_speech_duration_s=CHUNK_SECONDS)
+        speech = get_speech_timestamps(audio, vad_options)
+        return [{"start": c["start"], "end": c["end"]} for c in merge_segments(speech, vad_options)]
+    
+    step = CHUNK_SECONDS * SAMPLING_RATE
+    return [{"start": start, "end": min(start + step, len(audio))}
+            for start in range(0, len(audio), step)]
+
+
+def _detect_languages(model, clips, batch_size=8):
+    """
+    Detect the language of several clips with batched encoder passes.
+    
+    Args:
+        model (WhisperModel): The loaded Whisper model
+        clips (list): 16 kHz mono audio clips of at most 30 seconds
+        batch_size (int): Clips encoded per forward pass
+        
+    Returns:
+        list: Language codes, one per clip
+    """
+    if not model.model.is_multilingual:
+        return ["en"] * len(clips)
+    
+    languages = []
+    for i in range(0, len(clips), batch_size):
+        features = np.stack([
+            pad_or_trim(model.feature_extractor(clip)[..., :-1])
+            for clip in clips[i:i + batch_size]
+        ])
+        # One (token, probability) list per clip, most likely first, e.g. ("<|en|>", 0.98)
+        for result in model.model.detect_language(model.encode(features)):
+            languages.append(result[0][0][2:-2])
+    return languages
+
+
+def _transcribe_group(model, pipeline, files, output_dir, batch_size, language=None):
+    """
+    Transcribe a bounded group of decoded files with clips batched together.
+    
+    Files that share a language are laid end to end and all of their clips
+    are padded and encoded batch_size at a time, so short reels fill the
+    batch together. Segments are then split back out per file.
+    
+    Args:
+        model (WhisperModel): The loaded Whisper model
+        pipeline (BatchedInferencePipeline): Batched pipeline wrapping the model
+        files (list): (audio_path, audio, clips) tuples
+        output_dir (Path): Directory to save the transcripts
+        batch_size (int): Clips encoded per forward pass
+        language (str): Language code (e.g. "en"); detected when None
+        
+    Returns:
+        dict: Transcription results keyed by audio path
+    """
+    results = {}
+    languages = {}
+    speech_files = [f for f in files if f[2]]
+    
+    if speech_files and language is None:
+        # A batch needs a single language, so detect each file's on its first clip
+        try:
+            detected = _detect_languages(
+                model,
+                [audio[clips[0]["start"]:clips[0]["end"]] for _, audio, clips in speech_files],
+                batch_size
+            )
+        except Exception as e:
+            print(f"Error detecting language: {e}")
+            return {audio_path: {"error": str(e)} for audio_path, _, _ in files}
+    else:
+        detected = [language] * len(speech_files)
+    
+    for file, file_language in zip(speech_files, detected):
+        languages.setdefault(file_language, []).append(file)
+    if len(speech_files) < len(files):
+        languages[None] = [f for f in files if not f[2]]
+    
+    for language, language_files in languages.items():
+        transcript_paths = [output_dir / f"{Path(p).stem}_whisper_transcript.json"
+                            for p, _, _ in language_files]
+        
+        if language is None:
+            # No speech detected in these files
+            for (audio_path, _, _), transcript_path in zip(language_files, transcript_paths):
+                results[audio_path] = _save_transcript([], None, transcript_path)
+            continue
+        
+        # Shift each file's clips onto the timeline of the concatenated audio
+        offsets = []
+        clip_timestamps = []
+        offset = 0
+        for _, audio, clips in language_files:
+            offsets.append(offset)
+            clip_timestamps.extend({"start": c["start"] + offset, "end": c["end"] + offset} for c in clips)
+            offset += len(audio)
+        
+        print(f"Transcribing {len(language_files)} file(s) "
+              f"({len(clip_timestamps)} clips, language: {language})")
+        try:
+            segments, _ = pipeline.transcribe(
+                np.concatenate([audio for _, audio, _ in language_files]),
+                language=language,
+                beam_size=5,
+                clip_timestamps=clip_timestamps,
+                batch_size=batch_size
+            )
+            
+            # Segments never cross clips, so each one's midpoint identifies its file
+            per_file = [[] for _ in language_files]
+            for segment in segments:
+                midpoint = (segment.start + segment.end) / 2 * SAMPLING_RATE
+                per_file[bisect.bisect_right(offsets, midpoint) - 1].append(segment)
+        except Exception as e:
+            print(f"Error transcribing audio: {e}")
+            for audio_path, _, _ in language_files:
+                results[audio_path] = {"error": str(e)}
+            continue
+        
+        for (audio_path, _, _), file_segments, file_offset, transcript_path in zip(
+                language_files, per_file, offsets, transcript_paths):
+            results[audio_path] = _save_transcript(
+                file_segments, language, transcript_path, file_offset / SAMPLING_RATE
+            )
+    
+    return results
+
+
+def _transcribe_batched(model, audio_paths, output_dir, vad=True, batch_size=8, language=None):
+    """
+    Transcribe several audio files with their clips batched through the encoder.
+    
+    Every file is cut into clips of at most 30 seconds. Files are decoded
+    and transcribed in groups of about GROUP_BATCHES full batches, so only
+    one group's audio is held in memory at a time.
+    
+    Args:
+        model (WhisperModel): The loaded Whisper model
+        audio_paths (list): Paths to the audio files
+        output_dir (Path): Directory to save the transcripts
+        vad (bool): Whether to skip non-speech regions before transcribing
+        batch_size (int): Clips encoded per forward pass
+        language (str): Language code (e.g. "en"); detected when None
+        
+    Returns:
+        dict: Transcription results keyed by audio path
+    """
+    results = {}
+    pipeline = BatchedInferencePipeline(model=model)
+    group = []
+    group_clips = 0
+    for audio_path in audio_paths:
+        try:
+            audio = decode_audio(audio_path, sampling_rate=SAMPLING_RATE)
+            clips = _speech_clips(audio, vad)
+        except Exception as e:
+            print(f"Error preparing {audio_path}: {e}")
+            results[audio_path] = {"error": str(e)}
+            continue
+        
+        speech = sum(c["end"] - c["start"] for c in clips) / SAMPLING_RATE
+        print(f"{audio_path}: {speech:.1f}s of {len(audio) / SAMPLING_RATE:.1f}s in {len(clips)} clip(s)")
+        group.append((audio_path, audio, clips))
+        group_clips += len(clips)
+        
+        if group_clips >= batch_size * GROUP_BATCHES:
+            results.update(_transcribe_group(model, pipeline, group, output_dir, batch_size, language))
+            group = []
+            group_clips = 0
+    
+    if group:
+        results.update(_transcribe_group(model, pipeline, group, output_dir, batch_size, language))
+    
+    return results
+
+
+def _transcribe_in_worker(audio_path, output_dir, vad=True, language=None):
+    """Transcribe an audio file inside a process-pool worker."""
+    try:
+        return _transcribe_with_model(_worker_model, Path(audio_path), Path(output_dir), vad, language)
+    except Exception as e:
+        print(f"Error transcribing audio: {e}")
+        return {"error": str(e)}
+
+
+def transcribe_audio(audio_path, model_name="base", output_dir="transcripts", vad=True,
+                     language=None):
     """
     Transcribe an audio file using Whisper.
     
@@ -20,6 +386,8 @@ def transcribe_audio(audio_path, model_name="base", output_dir="transcripts"):
         audio_path (str): Path to the audio file
         model_name (str): Whisper model to use (tiny, base, small, medium, large)
         output_dir (str): Directory to save the transcript
+        vad (bool): Whether to skip non-speech regions before transcribing
+        language (str): Language code (e.g. "en"); detected when None
         
     Returns:
         dict: Transcription result
@@ -32,49 +400,116 @@ def transcribe_audio(audio_path, model_name="base", output_dir="transcripts"):
     output_dir = Path(output_dir)
     output_dir.mkdir(exist_ok=True)
     
-    transcript_path = output_dir / f"{audio_path.stem}_whisper_transcript.json"
-    
-    print(f"Loading Whisper model: {model_name}")
     try:
-        # Load the Whisper model
-        model = whisper.load_model(model_name)
-        
-        print(f"Transcribing audio: {audio_path}")
-        # Transcribe the audio
-        result = model.transcribe(str(audio_path))
-        
-        # Extract the transcript
-        transcript = {
-            "text": result["text"],
-            "segments": result["segments"],
-            "language": result["language"]
-        }
-        
-        # Save the transcript
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, indent=2)
-        
-        print(f"Transcript saved: {transcript_path}")
-        return transcript
+        # Load the Whisper model (cached between calls)
+        model = load_model(model_name)
+        return _transcribe_with_model(model, audio_path, output_dir, vad, language)
     
     except Exception as e:
         print(f"Error transcribing audio: {e}")
         return {"error": str(e)}
 
 
+def transcribe_batch(audio_paths, model_name="base", output_dir="transcripts",
+                     workers=max(1, (os.cpu_count() or 2) // 2), vad=True, batch_size=8,
+                     language=None):
+    """
+    Transcribe several audio files, loading the Whisper model only once.
+    
+    On GPU the files are transcribed in this process so the model stays
+    resident on the device, with clips from all files batched through the
+    encoder together. On CPU they are spread over a
+    process pool where each worker loads the model once.
+    
+    Args:
+        audio_paths (list): Paths to the audio files
+        model_name (str): Whisper model to use (tiny, base, small, medium, large)
+        output_dir (str): Directory to save the transcripts
+        workers (int): Number of worker processes to use on CPU
+        vad (bool): Whether to skip non-speech regions before transcribing
+        batch_size (int): Clips encoded per forward pass on GPU
+        language (str): Language code (e.g. "en"); detected when None
+        
+    Returns:
+        dict: Transcription results keyed by audio path
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(exist_ok=True)
+    
+    results = {}
+    pending = []
+    for audio_path in audio_paths:
+        if os.path.exists(audio_path):
+            pending.append(str(audio_path))
+        else:
+            print(f"Audio file not found: {audio_path}")
+            results[str(audio_path)] = {"error": "Audio file not found"}
+    
+    if not pending:
+        return results
+    
+    if cuda_available():
+        try:
+            model = load_model(model_name)
+        except Exception as e:
+            print(f"Error loading Whisper model: {e}")
+            return {**results, **{p: {"error": str(e)} for p in pending}}
+        
+        results.update(_transcribe_batched(model, pending, output_dir, vad, batch_size, language))
+        return results
+    
+    workers = max(1, min(workers, len(pending)))
+    # Split the cores between workers so their CTranslate2 threads don't oversubscribe
+    cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker,
+                             initargs=(model_name, cpu_threads)) as executor:
+        futures = {p: executor.submit(_transcribe_in_worker, p, str(output_dir), vad, language) for p in pending}
+        for audio_path, future in futures.items():
+            try:
+                results[audio_path] = future.result()
+            except Exception as e:
+                print(f"Error transcribing audio: {e}")
+                results[audio_path] = {"error": str(e)}
+    
+    return results
+
+
 def main():
     """Parse arguments and run the transcription."""
     parser = argparse.ArgumentParser(description='Transcribe audio using Whisper')
-    parser.add_argument('audio_path', help='Path to the audio file')
+    parser.add_argument('audio_paths', nargs='+', help='Path(s) to the audio file(s)')
     parser.add_argument('--model', default='base', 
                         choices=['tiny', 'base', 'small', 'medium', 'large'],
                         help='Whisper model to use (default: base)')
     parser.add_argument('--output-dir', default='transcripts',
                         help='Directory to save the transcript (default: transcripts)')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='Worker processes for CPU batch transcription')
+    parser.add_argument('--no-vad', action='store_true',
+                        help='Transcribe the whole file instead of only detected speech')
+    parser.add_argument('--batch-size', type=int, default=8,
+                        help='Clips from all files encoded together on GPU batch runs (default: 8)')
+    parser.add_argument('--language', default=None,
+                        help='Language code of the audio, e.g. en (default: detect)')
     
     args = parser.parse_args()
     
-    transcript = transcribe_audio(args.audio_path, args.model, args.output_dir)
+    if len(args.audio_paths) > 1:
+        results = transcribe_batch(args.audio_paths, args.model, args.output_dir,
+                                   args.workers, vad=not args.no_vad,
+                                   batch_size=args.batch_size, language=args.language)
+        print("\nTranscription completed!")
+        for audio_path, transcript in results.items():
+            if "error" in transcript:
+                print(f"{audio_path}: Error: {transcript['error']}")
+            else:
+                print(f"{audio_path}: {transcript['text']}")
+        return
+    
+    transcript = transcribe_audio(args.audio_paths[0], args.model, args.output_dir,
+                                  vad=not args.no_vad, language=args.language)
     
     if "error" in transcript:
         print(f"Error: {transcript['error']}")
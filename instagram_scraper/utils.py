@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Instagram scraper scripts.
+"""
+
+import re
+import json
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Compiled once at import instead of on every extract_reel_id call
+_REEL_RE = re.compile(r'/(reel|reels|p)/([^/]+)')
+
+
+def extract_reel_id(url):
+    """Extract the reel ID from the URL.
+    
+    Args:
+        url (str): The Instagram reel URL
+        
+    Returns:
+        str: The reel ID
+    """
+    match = _REEL_RE.search(urlparse(url).path)
+    return match.group(2) if match else None
+
+
+def save_json(data, path, indent=True):
+    """Write data to a JSON file, using orjson when it is installed.
+    
+    Args:
+        data (dict): The data to save
+        path (str): Path to the output file
+        indent (bool): Whether to pretty-print with two-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        if indent:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))